@@ -1,22 +1,25 @@
-from datetime import timedelta
+from types import MappingProxyType
 
-# Definition of maximum deviations from the given frequency
-deltdic = {}
-deltdic["monmax"] = timedelta(days=31.5).total_seconds()
-deltdic["monmin"] = timedelta(days=27.5).total_seconds()
-deltdic["mon"] = timedelta(days=31).total_seconds()
-deltdic["daymax"] = timedelta(days=1.1).total_seconds()
-deltdic["daymin"] = timedelta(days=0.9).total_seconds()
-deltdic["day"] = timedelta(days=1).total_seconds()
-deltdic["1hrmin"] = timedelta(hours=0.9).total_seconds()
-deltdic["1hrmax"] = timedelta(hours=1.1).total_seconds()
-deltdic["1hr"] = timedelta(hours=1).total_seconds()
-deltdic["3hrmin"] = timedelta(hours=2.9).total_seconds()
-deltdic["3hrmax"] = timedelta(hours=3.1).total_seconds()
-deltdic["3hr"] = timedelta(hours=3).total_seconds()
-deltdic["6hrmin"] = timedelta(hours=5.9).total_seconds()
-deltdic["6hrmax"] = timedelta(hours=6.1).total_seconds()
-deltdic["6hr"] = timedelta(hours=6).total_seconds()
-deltdic["yrmax"] = timedelta(days=366.1).total_seconds()
-deltdic["yrmin"] = timedelta(days=359.9).total_seconds()
-deltdic["yr"] = timedelta(days=360).total_seconds()
+# Definition of maximum deviations from the given frequency (in seconds)
+deltdic = MappingProxyType(
+    {
+        "monmax": 2721600.0,  # 31.5 days
+        "monmin": 2376000.0,  # 27.5 days
+        "mon": 2678400.0,  # 31 days
+        "daymax": 95040.0,  # 1.1 days
+        "daymin": 77760.0,  # 0.9 days
+        "day": 86400.0,  # 1 day
+        "1hrmin": 3240.0,  # 0.9 hours
+        "1hrmax": 3960.0,  # 1.1 hours
+        "1hr": 3600.0,  # 1 hour
+        "3hrmin": 10440.0,  # 2.9 hours
+        "3hrmax": 11160.0,  # 3.1 hours
+        "3hr": 10800.0,  # 3 hours
+        "6hrmin": 21240.0,  # 5.9 hours
+        "6hrmax": 21960.0,  # 6.1 hours
+        "6hr": 21600.0,  # 6 hours
+        "yrmax": 31631040.0,  # 366.1 days
+        "yrmin": 31095360.0,  # 359.9 days
+        "yr": 31104000.0,  # 360 days
+    }
+)
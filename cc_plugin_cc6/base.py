@@ -1,10 +1,14 @@
 import json
+import logging
+import math
 import os
 import re
-from collections import ChainMap
 from datetime import datetime as dt
+from functools import lru_cache
 from hashlib import md5
+from itertools import chain, repeat
 from pathlib import Path
+from types import SimpleNamespace
 
 import cf_xarray  # noqa
 import cftime
@@ -16,10 +20,156 @@ from cc_plugin_cc6 import __version__
 
 from ._constants import deltdic
 
-get_tseconds = lambda t: t.total_seconds()  # noqa
-get_tseconds_vector = np.vectorize(get_tseconds)
-get_abs_tseconds = lambda t: abs(t.total_seconds())  # noqa
-get_abs_tseconds_vector = np.vectorize(get_abs_tseconds)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Tables of the CV that are no variable tables
+CV_TABLES = frozenset({"CV", "grids", "coordinate", "formula_terms"})
+
+# Translation of the POSIX-style regex elements used in the CV to Python regex,
+#  all elements are replaced in a single pass with POSIX_TRANSLATION_RE
+POSIX_TRANSLATION = {
+    "[[:alnum:]]": "[a-zA-Z0-9]",
+    "[[:alpha:]]": "[a-zA-Z]",
+    "[[:blank:]]": "[ \t]",
+    "[[:digit:]]": r"\d",
+    "[[:lower:]]": "[a-z]",
+    "[[:punct:]]": r"[!-/:-@\[-`{-~]",
+    "[[:space:]]": r"\s",
+    "[[:upper:]]": "[A-Z]",
+    "[[:word:]]": r"\w",
+    "[[:xdigit:]]": "[0-9a-fA-F]",
+    r"\{": "{",
+    r"\}": "}",
+}
+POSIX_TRANSLATION_RE = re.compile("|".join(map(re.escape, POSIX_TRANSLATION)))
+
+# Characters with a special meaning in (Python) regular expressions
+REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+# Elements of a CV regex that change their meaning within an alternation of several
+#  CV entries: inline flags / groups with '(?' and numbered backreferences
+CV_REGEX_NOT_COMBINABLE_RE = re.compile(r"\(\?|\\[1-9]")
+
+# Maximum number of timesteps reported individually per issue in the time checks
+MAX_OFFENDER_MESSAGES = 100
+
+# File names of the CV and CMOR tables, '<project_id>_<table_id>.json'
+TABLE_FILENAME_RE = re.compile(r"([^_]*)_([^.]*)\.json")
+
+# Format of the version (vYYYYMMDD) and creation_date (YYYY-MM-DDTHH:MM:SSZ)
+VERSION_RE = re.compile(r"v[0-9]{8}")
+CREATION_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}Z")
+
+# strftime formats of the time stamps in the time_range DRS element, by length
+TIME_RANGE_FORMATS = {
+    4: "%4Y",
+    6: "%4Y%2m",
+    8: "%4Y%2m%2d",
+    10: "%4Y%2m%2d%2H",
+    12: "%4Y%2m%2d%2H%2M",
+}
+
+# DRS building blocks in the path and filename templates, eg. '<variable_id>'
+DRS_BLOCK_RE = re.compile(r"<([^<>]*)>")
+
+# Time units of fixed length in seconds, as understood by cftime
+#  ('months' and 'years' are of fixed length only for some calendars and not listed)
+TIME_UNITS_SECONDS = {
+    "microseconds": 1e-6,
+    "microsecond": 1e-6,
+    "milliseconds": 1e-3,
+    "millisecond": 1e-3,
+    "seconds": 1.0,
+    "second": 1.0,
+    "secs": 1.0,
+    "sec": 1.0,
+    "s": 1.0,
+    "minutes": 60.0,
+    "minute": 60.0,
+    "mins": 60.0,
+    "min": 60.0,
+    "hours": 3600.0,
+    "hour": 3600.0,
+    "hrs": 3600.0,
+    "hr": 3600.0,
+    "h": 3600.0,
+    "days": 86400.0,
+    "day": 86400.0,
+    "d": 86400.0,
+}
+TIME_UNITS_RE = re.compile(r"\s*(\w+)\s+since\s")
+
+
+def seconds_per_time_unit(timeunits):
+    """Return the length in seconds of the unit of CF time units like 'days since ...' (or None)."""
+    match = TIME_UNITS_RE.match(timeunits)
+    if match is None:
+        return None
+    return TIME_UNITS_SECONDS.get(match.group(1).lower(), None)
+
+
+def parse_version_date(version):
+    """Return the date of a version string 'vYYYYMMDD' (format matched by VERSION_RE)."""
+    return dt(int(version[1:5]), int(version[5:7]), int(version[7:9]))
+
+
+def parse_creation_date(creation_date):
+    """Return the datetime of a 'YYYY-MM-DDTHH:MM:SSZ' string (format matched by CREATION_DATE_RE)."""
+    s = creation_date
+    return dt(
+        int(s[0:4]),
+        int(s[5:7]),
+        int(s[8:10]),
+        int(s[11:13]),
+        int(s[14:16]),
+        int(s[17:19]),
+    )
+
+
+def get_tseconds_vector(deltas):
+    """Return the total seconds of an array of timedeltas as float array."""
+    deltas = np.asarray(deltas)
+    # datetime.timedelta objects (eg. differences of cftime dates) are cast
+    #  to timedelta64 at once instead of calling total_seconds() per element
+    if deltas.dtype.kind != "m":
+        deltas = deltas.astype("timedelta64[us]")
+    return deltas / np.timedelta64(1, "s")
+
+
+def isclose(a, b, rtol=1e-05, atol=1e-08):
+    """Scalar version of np.isclose, an unset value (None) is never close."""
+    if a is None or b is None:
+        return False
+    a = float(a)
+    b = float(b)
+    return a == b or abs(a - b) <= atol + rtol * abs(b)
+
+
+def find_discontinuities(deltas, lo, hi):
+    """Return the indices of the time deltas (s) outside of the interval [lo, hi]."""
+    deltas = np.asarray(deltas, dtype=np.float64)
+    return np.flatnonzero((deltas < lo) | (deltas > hi))
+
+
+def scan_time_bounds(t, lo, hi):
+    """
+    Return the indices of overlapping, uncentered and not strong monotonically
+    increasing time bounds, given the time values and the lower and upper bounds.
+    """
+    overlap_idx = np.flatnonzero(lo[1:] - hi[:-1] != 0)
+    # Twice the time value minus both bounds, computed in a single buffer
+    centered = np.add(t, t, dtype=np.result_type(t, lo, hi))
+    centered -= hi
+    centered -= lo
+    uncentered_idx = np.flatnonzero(centered)
+    # Negated comparison, so that NaN is reported as well
+    nonmonotonic_idx = np.flatnonzero(~(hi - lo > 0))
+    return overlap_idx, uncentered_idx, nonmonotonic_idx
 
 
 def printtimedelta(d):
@@ -34,6 +184,99 @@ def printtimedelta(d):
         return f"{d} seconds"
 
 
+def offender_messages(idx, format_message):
+    """
+    Format one message per offending index, the offenders beyond
+    MAX_OFFENDER_MESSAGES are only counted in a final message.
+    """
+    messages = [format_message(i) for i in idx[:MAX_OFFENDER_MESSAGES]]
+    if len(idx) > MAX_OFFENDER_MESSAGES:
+        messages.append(
+            f"... and {len(idx) - MAX_OFFENDER_MESSAGES} more timestep(s) with the same issue."
+        )
+    return messages
+
+
+def _json_scalar(value):
+    """Return a (numpy) scalar as Python scalar for the JSON output, NaN and inf as None."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    # Both orjson and the json module then write null (valid JSON)
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _is_literal_CV_entry(el):
+    """Check if a CV entry contains no regex metacharacters (matching is then string equality)."""
+    return REGEX_METACHARS.isdisjoint(el)
+
+
+@lru_cache(maxsize=4096)
+def _compile_CV_regex(pattern):
+    """Translate a CV entry (with POSIX-style character classes) into a compiled regex."""
+    # Most CV entries are plain values without any POSIX-style elements
+    if "[[:" in pattern or "\\" in pattern:
+        pattern = POSIX_TRANSLATION_RE.sub(
+            lambda m: POSIX_TRANSLATION[m.group(0)], pattern
+        )
+    return re.compile(pattern, flags=re.ASCII)
+
+
+@lru_cache(maxsize=16)
+def _canonical_path(path):
+    """Return the expanded and resolved path (cached, eg. for the tables path)."""
+    # realpath returns a normalized path already
+    return os.path.realpath(os.path.expanduser(path))
+
+
+@lru_cache(maxsize=1024)
+def _compile_CV_list_regex(patterns):
+    """
+    Combine the (translated) entries of a CV list into a single alternation regex.
+
+    Returns None if an entry cannot be part of an alternation (inline flags,
+    backreferences), the entries then have to be matched one by one.
+    """
+    if any(CV_REGEX_NOT_COMBINABLE_RE.search(p) for p in patterns):
+        return None
+    return re.compile(
+        "|".join(f"(?:{_compile_CV_regex(p).pattern})" for p in patterns),
+        flags=re.ASCII,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _CV_list_entries(entries):
+    """Return the entries of a CV list (given as tuple) as frozenset and their combined regex."""
+    return frozenset(entries), _compile_CV_list_regex(entries)
+
+
+def _scan_tables(path):
+    """Return the file names and modification times of the CV and CMOR tables under path."""
+    with os.scandir(path) as entries:
+        return tuple(
+            (t.name, t.stat().st_mtime_ns)
+            for t in entries
+            if t.name.endswith(".json") and "example" not in t.name and t.is_file()
+        )
+
+
+@lru_cache(maxsize=None)
+def _load_cv_json(path, mtime):
+    """Read and parse a CV / CMOR table, caching the result per path and modification time.
+
+    The returned dictionary is shared between checker instances and must not be modified.
+    """
+    # Read the raw bytes at once, both parsers decode UTF-8 themselves
+    content = Path(path).read_bytes()
+    # orjson parses considerably faster than the json module, if available
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 class MIPCVCheckBase(BaseCheck):
     register_checker = False
     _cc_spec = "mip"
@@ -45,6 +288,19 @@ class MIPCVCheckBase(BaseCheck):
 
 class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
     register_checker = True
+    # Level of the debug messages (raised with the 'debug' option)
+    debug_level = logging.DEBUG
+    # Specify the global attributes that will be checked by a specific check
+    #  rather than a general check against the value given in the CV
+    #  (i.e. because it is not explicitly defined in the CV)
+    global_attrs_hard_checks = frozenset(
+        {
+            "creation_date",
+            "time_range",
+            "variable_id",
+            "version",
+        }
+    )
 
     @classmethod
     def make_result(cls, level, score, out_of, name, messages):
@@ -58,12 +314,20 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
             os.path.normpath(os.path.expanduser(self.dataset.filepath()))
         )
         # xarray.Dataset
+        #  (opened separately, since xarray would change the masking and scaling
+        #   settings of the netCDF4.Dataset shared with the other checkers)
         self.xrds = xr.open_dataset(
             self.filepath, decode_coords=True, decode_times=False
         )
+        # All data and coordinate variables
+        self.all_vars = (*self.xrds.data_vars, *self.xrds.coords)
+        # Global attributes (read once from file)
+        self.global_attrs = self.dataset.__dict__
         # Options
         if "debug" in self.options:
             self.debug = True
+            # The debug messages are shown without any logging configuration
+            self.debug_level = logging.WARNING
         else:
             self.debug = False
         # Input options
@@ -82,72 +346,118 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
                 "ERROR: No 'tables' option specified. Cannot initialize CV and MIP tables."
             )
 
-        # Specify the global attributes that will be checked by a specific check
-        #  rather than a general check against the value given in the CV
-        #  (i.e. because it is not explicitly defined in the CV)
-        self.global_attrs_hard_checks = [
-            "creation_date",
-            "time_range",
-            "variable_id",
-            "version",
-        ]
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _get_cv_bundle(cls, tables_path, tables):
+        """Read the CV and CMOR tables under the given (canonical) path once per checker class.
 
-    def _initialize_CV_info(self, tables_path):
-        """Find and read CV and CMOR tables and extract basic information."""
-        # Identify table prefix and table names
-        tables_path = os.path.normpath(
-            os.path.realpath(os.path.expanduser(tables_path))
-        )
-        tables = [
-            t
-            for t in os.listdir(tables_path)
-            if os.path.isfile(os.path.join(tables_path, t))
-            and t.endswith(".json")
-            and "example" not in t
-        ]
-        table_prefix = tables[0].split("_")[0]
-        table_names = ["_".join(t.split("_")[1:]).split(".")[0] for t in tables]
-        if not all([table_prefix + "_" + t + ".json" in tables for t in table_names]):
+        The tables are given as tuple of (file name, modification time) pairs,
+        so that added, removed or modified tables are picked up.
+
+        The returned bundle is shared between checker instances and must not be modified.
+        """
+        # Split into '<project_id>_<table_id>.json' in a single pass
+        matches = [TABLE_FILENAME_RE.fullmatch(t) for t, _ in tables]
+        if not all(matches) or len({m.group(1) for m in matches}) > 1:
             raise ValueError(
                 "CMOR tables do not follow the naming convention '<project_id>_<table_id>.json'."
             )
-        # Read CV and coordinate tables
-        self.CV = self._read_CV(tables_path, table_prefix, "CV")["CV"]
-        self.CTcoords = self._read_CV(tables_path, table_prefix, "coordinate")
-        self.CTgrids = self._read_CV(tables_path, table_prefix, "grids")
-        self.CTformulas = self._read_CV(tables_path, table_prefix, "formula_terms")
-        # Read variable tables (variable tables)
-        self.CT = {}
-        for table in table_names:
-            if table in ["CV", "grids", "coordinate", "formula_terms"]:
+        table_prefix = matches[0].group(1)
+        table_names = [m.group(2) for m in matches]
+        # Read all tables at once
+        CVs = cls._read_CVs(tables_path, table_prefix, table_names)
+        # CV and coordinate tables
+        CTgrids = CVs["grids"]
+        CTcoords = CVs["coordinate"]
+        CTformulas = CVs["formula_terms"]
+        # Compile set of all CV coordinates, grids, formula_terms
+        cvars = frozenset(
+            entry["out_name"]
+            for table, key in (
+                (CTgrids, "axis_entry"),
+                (CTgrids, "variable_entry"),
+                (CTcoords, "axis_entry"),
+                (CTformulas, "formula_entry"),
+            )
+            for entry in table[key].values()
+        )
+        # Variable tables
+        CT = {}
+        for table in CVs:
+            if table in CV_TABLES:
                 continue
-            self.CT[table] = self._read_CV(tables_path, table_prefix, table)
-            if "variable_entry" not in self.CT[table]:
+            CT[table] = CVs[table]
+            if "variable_entry" not in CT[table]:
                 raise KeyError(
                     f"CMOR table '{table}' does not contain the key 'variable_entry'."
                 )
-            if "Header" not in self.CT[table]:
+            if "Header" not in CT[table]:
                 raise KeyError(
                     f"CMOR table '{table}' does not contain the key 'Header'."
                 )
             for key in ["table_id"]:
-                if key not in self.CT[table]["Header"]:
-                    print(table, key)
+                if key not in CT[table]["Header"]:
                     raise KeyError(
                         f"CMOR table '{table}' misses the key '{key}' in the header information."
                     )
         # Compile varlist for quick reference
-        varlist = list()
-        for table in table_names:
-            if table in ["CV", "grids", "coordinate", "formula_terms"]:
-                continue
-            varlist = varlist + list(self.CT[table]["variable_entry"].keys())
-        varlist = set(varlist)
+        varlist = frozenset(
+            var for table in CT.values() for var in table["variable_entry"]
+        )
+        CV = CVs["CV"]["CV"]
+        # DRS building blocks of the file path and name templates
+        try:
+            drs_path_template = tuple(
+                DRS_BLOCK_RE.findall(CV["DRS"]["directory_path_template"])
+            )
+            drs_filename_template = tuple(
+                DRS_BLOCK_RE.findall(CV["DRS"]["filename_template"])
+            )
+            drs_suffix = ".".join(CV["DRS"]["filename_template"].split(".")[1:])
+        except KeyError:
+            raise KeyError("The CV does not contain DRS information.")
+        required_attributes = tuple(CV.get("required_global_attributes", ()))
+        # Required global attributes that are also DRS building blocks
+        drs_blocks = frozenset(drs_path_template + drs_filename_template)
+        drs_attributes = tuple(a for a in required_attributes if a in drs_blocks)
+        return SimpleNamespace(
+            CV=CV,
+            required_attributes=required_attributes,
+            CTcoords=CTcoords,
+            CTgrids=CTgrids,
+            CTformulas=CTformulas,
+            cvars=cvars,
+            CT=CT,
+            varlist=varlist,
+            drs_path_template=drs_path_template,
+            drs_filename_template=drs_filename_template,
+            drs_suffix=drs_suffix,
+            drs_attributes=drs_attributes,
+        )
+
+    def _initialize_CV_info(self, tables_path):
+        """Find and read CV and CMOR tables and extract basic information."""
+        tables_path = _canonical_path(tables_path)
+        # The tables are identical for all files checked against the same
+        #  (unmodified) tables
+        bundle = type(self)._get_cv_bundle(tables_path, _scan_tables(tables_path))
+        self.CV = bundle.CV
+        self.required_attributes = bundle.required_attributes
+        self.CTcoords = bundle.CTcoords
+        self.CTgrids = bundle.CTgrids
+        self.CTformulas = bundle.CTformulas
+        self.cvars = bundle.cvars
+        self.CT = bundle.CT
+        varlist = bundle.varlist
+        self.drs_path_template = bundle.drs_path_template
+        self.drs_filename_template = bundle.drs_filename_template
+        self.drs_suffix = bundle.drs_suffix
+        self.drs_attributes = bundle.drs_attributes
         # Map DRS building blocks to the filename, filepath and global attributes
         self._map_drs_blocks()
         # Identify variable name(s)
-        var_ids = [v for v in varlist if v in list(self.dataset.variables.keys())]
-        self.varname = var_ids
+        #  (looking up the few file variables in the set of all table variables)
+        self.varname = tuple(v for v in self.dataset.variables if v in varlist)
         # Identify table_id, requested frequency and cell_methods
         self.table_id_raw = self._get_attr("table_id")
         if self.table_id_raw in self.CT:
@@ -157,28 +467,31 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
         self.frequency = self._get_var_attr(self.varname, "frequency", False)
         if not self.frequency:
             self.frequency = self._get_attr("frequency")
+        # Allowed range of time steps (s) for the frequency (None if not supported)
+        self.deltmin = deltdic.get(f"{self.frequency}min", None)
+        self.deltmax = deltdic.get(f"{self.frequency}max", None)
         # In case of unset table_id -
         #  in some projects (eg. CORDEX), the table_id is not required,
         #  since there is one table per frequency, so table_id = frequency.
         if self.table_id == "unknown":
             possible_ids = list()
             if len(self.varname) > 0:
-                for table in table_names:
-                    if table in ["CV", "grids", "coordinate", "formula_terms"]:
-                        continue
+                for table, CT in self.CT.items():
+                    variable_entry = CT["variable_entry"]
                     if (
-                        self.varname[0] in self.CT[table]["variable_entry"]
+                        self.varname[0] in variable_entry
                         and self.frequency
-                        == self.CT[table]["variable_entry"][self.varname[0]][
-                            "frequency"
-                        ]
+                        == variable_entry[self.varname[0]]["frequency"]
                     ):
                         possible_ids.append(table)
             if len(possible_ids) == 0:
-                possible_ids = [key for key in self.CT.keys() if self.frequency in key]
+                possible_ids = [key for key in self.CT if self.frequency in key]
             if len(possible_ids) == 1:
-                if self.debug:
-                    print("Determined possible table_id = ", possible_ids[0])
+                logger.log(
+                    self.debug_level,
+                    "Determined possible table_id = %s",
+                    possible_ids[0],
+                )
                 self.table_id = possible_ids[0]
 
         self.cell_methods = self._get_var_attr(self.varname, "cell_methods", "unknown")
@@ -196,28 +509,38 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
             self.time = self.xrds.cf["time"]
         except KeyError:
             self.time = None
+        # Cache for time values converted to cftime.datetime objects
+        self.num2date_cache = {}
         if self.time is not None:
-            time_attrs = ChainMap(self.time.attrs, self.time.encoding)
+            # Read the attributes from the netCDF4 variable directly
+            #  (regardless of what xarray moved from attrs to encoding)
+            time_attrs = self.dataset.variables[self.time.name].__dict__
             self.calendar = time_attrs.get("calendar", None)
             self.timeunits = time_attrs.get("units", None)
             self.timebnds = time_attrs.get("bounds", None)
+            # Length of the time unit in seconds (None if not of fixed length)
+            self.timeunits_seconds = (
+                seconds_per_time_unit(self.timeunits) if self.timeunits else None
+            )
             # Here, xarray decodes the time axis.
             # The entire checker crashes in case of invalid time units
             # todo: catch a possible exception in base._initialize_time_info
             #       and report the problem in any check method
+            #  Only the time variable is decoded, not a copy of the entire dataset.
             self.timedec = xr.decode_cf(
-                self.xrds.copy(deep=True), decode_times=True, use_cftime=True
-            ).cf["time"]
+                self.xrds[[self.time.name]], decode_times=True, use_cftime=True
+            )[self.time.name]
             self.time_invariant_vars = [
                 var
-                for var in list(self.xrds.data_vars.keys())
-                + list(self.xrds.coords.keys())
-                if self.time.name not in self.xrds[var].dims and var not in self.varname
+                for var in self.all_vars
+                if self.time.name not in self.xrds.variables[var].dims
+                and var not in self.varname
             ]
         else:
             self.calendar = None
             self.timeunits = None
             self.timebnds = None
+            self.timeunits_seconds = None
             self.timedec = None
             self.time_invariant_vars = []
 
@@ -225,64 +548,99 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
         """Get information about the infile coordinates."""
         # Compile list of coordinates from coords, axes and formula_terms
         #  also check for redundant bounds / coordinates
-        self.coords = []
         self.bounds = set()
         self.coords_redundant = dict()
         self.bounds_redundant = dict()
-        for bkey, bval in self.xrds.cf.bounds.items():
+        # Each cf_xarray mapping is built only once
+        cf = self.xrds.cf
+        #  (the coordinates mapping is also used by the checks)
+        self.cf_coordinates = cf.coordinates
+        for bkey, bval in cf.bounds.items():
             if len(bval) > 1:
                 self.bounds_redundant[bkey] = bval
             self.bounds.update(bval)
+        # Candidate coordinates, deduplicated in order of appearance below
+        coords = []
         # ds.cf.coordinates
         # {'longitude': ['lon'], 'latitude': ['lat'], 'vertical': ['height'], 'time': ['time']}
-        for ckey, clist in self.xrds.cf.coordinates.items():
+        for ckey, clist in self.cf_coordinates.items():
             _clist = [c for c in clist if c not in self.bounds]
             if len(_clist) > 1:
                 self.coords_redundant[ckey] = _clist
-            if _clist[0] not in self.coords:
-                self.coords.append(_clist[0])
+            if _clist:
+                coords.append(_clist[0])
         # ds.cf.axes
         # {'X': ['rlon'], 'Y': ['rlat'], 'Z': ['height'], 'T': ['time']}
-        for ckey, clist in self.xrds.cf.axes.items():
+        for ckey, clist in cf.axes.items():
             if len(clist) > 1:
                 if ckey not in self.coords_redundant:
                     self.coords_redundant[ckey] = clist
-            if clist[0] not in self.coords:
-                self.coords.append(clist[0])
+            coords.append(clist[0])
         # ds.cf.formula_terms
         # {"lev": {"a":"ab", "ps": "ps",...}}
-        for akey in self.xrds.cf.formula_terms.keys():
-            for ckey, cval in self.xrds.cf.formula_terms[akey].items():
-                if cval not in self.coords:
-                    self.coords.append(cval)
+        for terms in cf.formula_terms.values():
+            coords.extend(terms.values())
+        coords = dict.fromkeys(coords)
+        self.coords = list(coords)
 
         # Get the external variables
         self.external_variables = self._get_attr("external_variables", "").split()
 
         # Update list of variables
-        self.varname = [
-            v for v in self.varname if v not in self.coords and v not in self.bounds
-        ]
+        self.varname = tuple(
+            v for v in self.varname if v not in coords and v not in self.bounds
+        )
 
     def _get_attr(self, attr, default="unknown"):
         """Get nc attribute."""
-        try:
-            return self.dataset.getncattr(attr)
-        except AttributeError:
-            return default
+        return self.global_attrs.get(attr, default)
 
     def _get_var_attr(self, var, attr, default="unknown"):
         """Get nc variable attribute."""
-        if self.table_id != "unknown":
-            if len(self.varname) > 0:
-                try:
-                    return self.CT[self.table_id]["variable_entry"][self.varname[0]][
-                        attr
-                    ]
-                except KeyError:
-                    return default
+        if self.table_id != "unknown" and len(self.varname) > 0:
+            # Every table in self.CT has a 'variable_entry' (checked when reading the tables)
+            var_entry = self.CT[self.table_id]["variable_entry"].get(self.varname[0])
+            if var_entry is not None:
+                return var_entry.get(attr, default)
         return default
 
+    def _num2date(self, value):
+        """Convert an encoded time value to a cftime.datetime object, caching the result."""
+        try:
+            return self.num2date_cache[value]
+        except KeyError:
+            date = cftime.num2date(value, calendar=self.calendar, units=self.timeunits)
+            self.num2date_cache[value] = date
+            return date
+
+    def _deltas_in_seconds(self, values_a, values_b):
+        """Return the time deltas (s) between two arrays of encoded time values."""
+        if self.timeunits_seconds is not None:
+            # Directly from the encoded values, rounded to microseconds
+            #  (the resolution of cftime), no cftime conversion is necessary
+            return np.round((values_a - values_b) * self.timeunits_seconds, 6)
+        # Otherwise via cftime, converting both arrays in a single call
+        values_a = np.asarray(values_a)
+        dates = cftime.num2date(
+            np.concatenate((values_a, np.asarray(values_b))),
+            units=self.timeunits,
+            calendar=self.calendar,
+        )
+        return get_tseconds_vector(dates[: len(values_a)] - dates[len(values_a) :])
+
+    def _num2date_many(self, values):
+        """Convert many encoded time values in one call, filling the num2date cache."""
+        values = [
+            value
+            for value in dict.fromkeys(np.asarray(values).tolist())
+            if value not in self.num2date_cache
+        ]
+        if values:
+            dates = cftime.num2date(
+                values, calendar=self.calendar, units=self.timeunits
+            )
+            self.num2date_cache.update(zip(values, dates))
+
     def _infer_frequency(self):
         """Infer frequency from given time dimension"""
         try:
@@ -290,21 +648,34 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
         except ValueError:
             return "unknown"
 
-    def _read_CV(self, path, table_prefix, table_name):
+    @staticmethod
+    def _read_CV(path, table_prefix, table_name):
         """Reads the specified CV table."""
         table_path = Path(path, f"{table_prefix}_{table_name}.json")
         try:
-            with open(table_path) as f:
-                return json.load(f)
+            return _load_cv_json(str(table_path), os.path.getmtime(table_path))
         except (FileNotFoundError, IsADirectoryError, PermissionError) as e:
             raise Exception(
                 f"Could not find or open table '{table_prefix}_{table_name}.json' under path '{path}'."
             ) from e
 
+    @classmethod
+    def _read_CVs(cls, path, table_prefix, table_names):
+        """Reads all specified CV tables, preferably from the combined table '<table_prefix>_all.json'."""
+        CVs = {}
+        if "all" in table_names:
+            CVs.update(cls._read_CV(path, table_prefix, "all"))
+        # Tables missing in the combined table are read individually
+        #  (the CV tables are always requested, so that a missing one is reported)
+        for table_name in chain(table_names, sorted(CV_TABLES)):
+            if table_name != "all" and table_name not in CVs:
+                CVs[table_name] = cls._read_CV(path, table_prefix, table_name)
+        return CVs
+
     def _write_consistency_output(self):
         """Write output for consistency checks across files."""
         # Dictionary of global attributes
-        required_attributes = self.CV.get("required_global_attributes", {})
+        required_attributes = self.required_attributes
         file_attrs = {
             k: str(v) for k, v in self.xrds.attrs.items() if k in required_attributes
         }
@@ -313,10 +684,10 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
                 file_attrs[k] = "unset"
         # Dictionary of variable attributes
         var_attrs = {}
-        for var in list(self.xrds.data_vars.keys()) + list(self.xrds.coords.keys()):
+        for var in self.all_vars:
             var_attrs[var] = {
                 key: str(value)
-                for key, value in self.xrds[var].attrs.items()
+                for key, value in self.xrds.variables[var].attrs.items()
                 if key not in ["history"]
             }
         # Dictionary of time information
@@ -328,37 +699,43 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
             boundn = None
             if self.timebnds is not None:
                 try:
-                    bound0 = self.xrds[self.timebnds].values[0, 0]
-                    boundn = self.xrds[self.timebnds].values[-1, -1]
+                    # Only the two values are read, not the entire variable
+                    time_bnds = self.xrds.variables[self.timebnds]
+                    bound0 = time_bnds[0, 0].values[()]
+                    boundn = time_bnds[-1, -1].values[()]
                 except IndexError:
                     pass
             time_info = {
                 "frequency": self.frequency,
                 "units": self.timeunits,
                 "calendar": self.calendar,
-                "bound0": bound0,
-                "boundn": boundn,
-                "time0": self.time.values[0],
-                "timen": self.time.values[-1],
+                "bound0": _json_scalar(bound0),
+                "boundn": _json_scalar(boundn),
+                "time0": _json_scalar(self.time.values[0]),
+                "timen": _json_scalar(self.time.values[-1]),
             }
         # Dictionary of time_invariant variable checksums
         coord_checksums = {}
         for coord_var in self.time_invariant_vars:
             coord_checksums[coord_var] = md5(
-                str(self.xrds[coord_var].values.tobytes()).encode("utf-8")
+                self.xrds[coord_var].values.tobytes()
             ).hexdigest()
         # Write combined dictionary
-        with open(self.consistency_output, "w") as f:
-            json.dump(
-                {
-                    "global_attributes": file_attrs,
-                    "variable_attributes": var_attrs,
-                    "coordinates": coord_checksums,
-                    "time_info": time_info,
-                },
-                f,
-                indent=4,
-            )
+        consistency_info = {
+            "global_attributes": file_attrs,
+            "variable_attributes": var_attrs,
+            "coordinates": coord_checksums,
+            "time_info": time_info,
+        }
+        # orjson serializes considerably faster than the json module, if available
+        #  (the json module is set up to write equivalent output, only the
+        #   notation of floats with an exponent differs, eg. '1e20' and '1e+20')
+        if orjson is not None:
+            with open(self.consistency_output, "wb") as f:
+                f.write(orjson.dumps(consistency_info, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.consistency_output, "w", encoding="utf-8") as f:
+                json.dump(consistency_info, f, indent=2, ensure_ascii=False)
 
     def _compare_CV_element(self, el, val):
         """Compares value of a CV entry to a given value."""
@@ -375,66 +752,40 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
         # ########################################################################################
         # 0 (2nd+ level comparison) #
         if isinstance(el, str):
-            if self.debug:
-                print(val, "->0")
-            return (
-                bool(
-                    re.fullmatch(
-                        el.replace("[[:digit:]]", r"\d")
-                        .replace("\\{", "{")
-                        .replace("\\}", "}"),
-                        str(val),
-                        flags=re.ASCII,
-                    )
-                ),
-                [],
-            )
+            logger.log(self.debug_level, "%s ->0", val)
+            # Plain values are compared without the regex engine
+            if _is_literal_CV_entry(el):
+                return el == str(val), ()
+            return bool(_compile_CV_regex(el).fullmatch(str(val))), ()
         # 1 and 2 #
         elif isinstance(el, list):
-            if self.debug:
-                print(val, "->1 and 2")
-            if val not in el:
-
-                return (
-                    any(
-                        [
-                            bool(
-                                re.fullmatch(
-                                    eli.replace("[[:digit:]]", r"\d")
-                                    .replace("\\{", "{")
-                                    .replace("\\}", "}"),
-                                    str(val),
-                                    flags=re.ASCII,
-                                )
-                            )
-                            for eli in el
-                        ]
-                    ),
-                    [],
-                )
+            logger.log(self.debug_level, "%s ->1 and 2", val)
+            entries, regex = _CV_list_entries(tuple(el))
+            if val not in entries:
+                val = str(val)
+                if regex is None:
+                    return any(_compile_CV_regex(eli).fullmatch(val) for eli in el), ()
+                # One regex match against all entries of the list at once
+                return bool(regex.fullmatch(val)), ()
             else:
-                return True, []
+                return True, ()
         # 3 to 6 #
         elif isinstance(el, dict):
-            if self.debug:
-                print(val, "->3 to 6")
-            if val in el.keys():
+            logger.log(self.debug_level, "%s ->3 to 6", val)
+            if val in el:
+                el_val = el[val]
                 # 3 #
-                if isinstance(el[val], str):
-                    if self.debug:
-                        print(val, "->3")
-                    return True, []
+                if isinstance(el_val, str):
+                    return True, ()
                 # 4 to 6 #
-                elif isinstance(el[val], dict):
-                    if self.debug:
-                        print(val, "->4 to 6")
-                    return True, list(el[val].keys())
+                elif isinstance(el_val, dict):
+                    return True, el_val.keys()
                 else:
                     raise ValueError(
                         f"Unknown CV structure for element: {el} and value {val}."
                     )
             else:
-                return False, []
+                return False, ()
         # (Yet) unknown
         else:
             raise ValueError(
@@ -443,89 +794,69 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
 
     def _compare_CV(self, dic2comp, errmsg_prefix):
         """Compares dictionary of key-val pairs with CV."""
-        checked = {key: False for key in dic2comp.keys()}
+        CV = self.CV
+        # Keys that could be compared with the CV
+        checked = set()
         messages = []
-        for attr in dic2comp.keys():
-            if self.debug:
-                print(attr)
-            if attr in self.CV:
-                if self.debug:
-                    print(attr, "1st level")
-                errmsg = f"""{errmsg_prefix}'{attr}' does not comply with the CV: '{dic2comp[attr] if dic2comp[attr] else 'unset'}'."""
-                checked[attr] = True
-                test, attrs_lvl2 = self._compare_CV_element(
-                    self.CV[attr], dic2comp[attr]
-                )
-                # If comparison fails
+        for attr, val in dic2comp.items():
+            logger.log(self.debug_level, "%s", attr)
+            if attr in CV:
+                logger.log(self.debug_level, "%s 1st level", attr)
+                cv_el = CV[attr]
+                checked.add(attr)
+                test, attrs_lvl2 = self._compare_CV_element(cv_el, val)
+                # If comparison fails (the message is only formatted in this case)
                 if not test:
-                    messages.append(errmsg)
+                    messages.append(
+                        f"""{errmsg_prefix}'{attr}' does not comply with the CV: '{val if val else 'unset'}'."""
+                    )
                 # If comparison could not be processed completely, as the CV element is another dictionary
-                else:
+                elif attrs_lvl2:
+                    cv_el_lvl2 = cv_el[val]
                     for attr_lvl2 in attrs_lvl2:
-                        if attr_lvl2 in dic2comp.keys():
-                            if self.debug:
-                                print(attr, "2nd level")
-                            errmsg_lvl2 = f"""{errmsg_prefix}'{attr_lvl2}' does not comply with the CV: '{dic2comp[attr_lvl2] if dic2comp[attr_lvl2] else 'unset'}'."""
-                            checked[attr_lvl2] = True
+                        if attr_lvl2 in dic2comp:
+                            logger.log(self.debug_level, "%s 2nd level", attr)
+                            val_lvl2 = dic2comp[attr_lvl2]
+                            checked.add(attr_lvl2)
                             try:
                                 test, attrs_lvl3 = self._compare_CV_element(
-                                    self.CV[attr][dic2comp[attr]][attr_lvl2],
-                                    dic2comp[attr_lvl2],
+                                    cv_el_lvl2[attr_lvl2], val_lvl2
                                 )
                             except ValueError:
                                 raise ValueError(
-                                    f"Unknown CV structure for element {attr} -> {self.CV[attr][dic2comp[attr]][attr_lvl2]} / {attr_lvl2} -> {dic2comp[attr_lvl2]}."
+                                    f"Unknown CV structure for element {attr} -> {cv_el_lvl2[attr_lvl2]} / {attr_lvl2} -> {val_lvl2}."
                                 )
                             if not test:
-                                messages.append(errmsg_lvl2)
+                                messages.append(
+                                    f"""{errmsg_prefix}'{attr_lvl2}' does not comply with the CV: '{val_lvl2 if val_lvl2 else 'unset'}'."""
+                                )
                             else:
                                 if len(attrs_lvl3) > 0:
                                     raise ValueError(
-                                        f"Unknown CV structure for element {attr} -> {dic2comp[attr]} -> {attr_lvl2}."
+                                        f"Unknown CV structure for element {attr} -> {val} -> {attr_lvl2}."
                                     )
         return checked, messages
 
     def _map_drs_blocks(self):
         """Maps the file metadata, name and location to the DRS building blocks and required attributes."""
-        try:
-            drs_path_template = re.findall(
-                r"<([^<>]*)\>", self.CV["DRS"]["directory_path_template"]
-            )
-            drs_filename_template = re.findall(
-                r"<([^<>]*)\>", self.CV["DRS"]["filename_template"]
-            )
-            self.drs_suffix = ".".join(
-                self.CV["DRS"]["filename_template"].split(".")[1:]
-            )
-        except KeyError:
-            raise KeyError("The CV does not contain DRS information.")
+        # The DRS templates are parsed once per tables path (see _get_cv_bundle)
+        drs_path_template = self.drs_path_template
+        drs_filename_template = self.drs_filename_template
 
-        # Map DRS path elements
-        self.drs_dir = {}
+        # Map DRS path elements (from the end of the path)
+        #  missing elements are set to False
         fps = os.path.dirname(self.filepath).split(os.sep)
-        for i in range(-1, -len(drs_path_template) - 1, -1):
-            try:
-                self.drs_dir[drs_path_template[i]] = fps[i]
-            except IndexError:
-                self.drs_dir[drs_path_template[i]] = False
+        self.drs_dir = dict(
+            zip(reversed(drs_path_template), chain(reversed(fps), repeat(False)))
+        )
 
         # Map DRS filename elements
-        self.drs_fn = {}
-        fns = os.path.basename(self.filepath).split(".")[0].split("_")
-        for i in range(len(drs_filename_template)):
-            try:
-                self.drs_fn[drs_filename_template[i]] = fns[i]
-            except IndexError:
-                self.drs_fn[drs_filename_template[i]] = False
+        fns = os.path.basename(self.filepath).partition(".")[0].split("_")
+        self.drs_fn = dict(zip(drs_filename_template, chain(fns, repeat(False))))
 
         # Map DRS global attributes
-        self.drs_gatts = {}
-        for gatt in self.CV["required_global_attributes"]:
-            if gatt in drs_path_template or gatt in drs_filename_template:
-                try:
-                    self.drs_gatts[gatt] = self.dataset.getncattr(gatt)
-                except AttributeError:
-                    self.drs_gatts[gatt] = False
+        gatts = self.global_attrs
+        self.drs_gatts = {gatt: gatts.get(gatt, False) for gatt in self.drs_attributes}
 
     def check_table_id(self, ds):
         """Table ID (CV)"""
@@ -590,11 +921,9 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
             messages.extend(drs_fn_messages)
 
         # Unchecked DRS path building blocks
-        unchecked = [
-            key
-            for key in self.drs_dir.keys()
-            if not drs_dir_checked[key] and key not in self.global_attrs_hard_checks
-        ]
+        unchecked = (
+            self.drs_dir.keys() - drs_dir_checked - self.global_attrs_hard_checks
+        )
         if len(unchecked) == 0:
             score += 1
         else:
@@ -603,11 +932,7 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
             )
 
         # Unchecked DRS filename building blocks
-        unchecked = [
-            key
-            for key in self.drs_fn.keys()
-            if not drs_fn_checked[key] and key not in self.global_attrs_hard_checks
-        ]
+        unchecked = self.drs_fn.keys() - drs_fn_checked - self.global_attrs_hard_checks
         if len(unchecked) == 0:
             score += 1
         else:
@@ -625,25 +950,25 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
         score = 0
         messages = []
 
+        drs_dir, drs_fn, drs_gatts = self.drs_dir, self.drs_fn, self.drs_gatts
         # Union of all DRS building blocks
-        blocks = sorted(
-            list(
-                set(self.drs_gatts.keys()).union(
-                    set(self.drs_fn.keys()).union(set(self.drs_dir.keys()))
-                )
-            )
-        )
+        blocks = sorted(drs_gatts.keys() | drs_fn.keys() | drs_dir.keys())
         flaw = False
         # Check if the values for the DRS building blocks are consistent
         for att in blocks:
-            atts = {
-                "file path": self.drs_dir.get(att, False),
-                "file name": self.drs_fn.get(att, False),
-                "global attributes": self.drs_gatts.get(att, False),
-            }
-            if len({x for x in atts.values() if x}) > 1:
+            # Set values by source (in alphabetical order of the sources)
+            atts = [
+                (key, val)
+                for key, val in (
+                    ("file name", drs_fn.get(att, False)),
+                    ("file path", drs_dir.get(att, False)),
+                    ("global attributes", drs_gatts.get(att, False)),
+                )
+                if val
+            ]
+            if len({val for key, val in atts}) > 1:
                 messages.append(
-                    f"""Value for DRS building block '{att}' is not consistent between {" and ".join(["'"+key+"'" for key in sorted(list(atts.keys())) if atts[key]])}: {" and ".join(["'"+atts[key]+"'" for key in sorted(list(atts.keys())) if atts[key]])}."""
+                    f"""Value for DRS building block '{att}' is not consistent between {" and ".join(["'"+key+"'" for key, val in atts])}: {" and ".join(["'"+val+"'" for key, val in atts])}."""
                 )
                 flaw = True
         if not flaw:
@@ -671,42 +996,33 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
             score += 1
 
         # Redundant coordinates /  bounds
-        if len(self.coords_redundant.keys()) > 0:
-            for key in self.coords_redundant.keys():
+        if len(self.coords_redundant) > 0:
+            for key in self.coords_redundant:
                 messages.append(
-                    f"Multiple coordinate variables found for '{key}': {', '.join(list(self.coords_redundant[key]))}"
+                    f"Multiple coordinate variables found for '{key}': {', '.join(self.coords_redundant[key])}"
                 )
         else:
             score += 1
-        if len(self.bounds_redundant.keys()) > 0:
-            for key in self.bounds_redundant.keys():
+        if len(self.bounds_redundant) > 0:
+            for key in self.bounds_redundant:
                 messages.append(
-                    f"Multiple bound variables found for '{key}': {', '.join(list(self.bounds_redundant[key]))}"
+                    f"Multiple bound variables found for '{key}': {', '.join(self.bounds_redundant[key])}"
                 )
         else:
             score += 1
 
-        # Create list of all CV coordinates, grids, formula_terms
-        cvars = []
-        for entry in self.CTgrids["axis_entry"].keys():
-            cvars.append(self.CTgrids["axis_entry"][entry]["out_name"])
-        for entry in self.CTgrids["variable_entry"].keys():
-            cvars.append(self.CTgrids["variable_entry"][entry]["out_name"])
-        for entry in self.CTcoords["axis_entry"].keys():
-            cvars.append(self.CTcoords["axis_entry"][entry]["out_name"])
-        for entry in self.CTformulas["formula_entry"].keys():
-            cvars.append(self.CTformulas["formula_entry"][entry]["out_name"])
-        cvars = set(cvars)
         # Add grid_mapping
+        crs = ()
         if len(self.varname) > 0:
-            crs = getattr(ds.variables[self.varname[0]], "grid_mapping", False)
-            if crs:
-                cvars |= {crs}
+            var = ds.variables[self.varname[0]]
+            if "grid_mapping" in var.ncattrs() and var.getncattr("grid_mapping"):
+                crs = (var.getncattr("grid_mapping"),)
         # Identify unknown variables / coordinates
-        unknown = []
-        for var in ds.variables.keys():
-            if var not in cvars and var not in self.varname and var not in self.bounds:
-                unknown.append(var)
+        #  (in a single pass, bounds have been identified in setup already)
+        #  All CV coordinates, grids, formula_terms are known, as well as the
+        #  requested variable(s), the bounds and the grid_mapping
+        known = self.cvars.union(self.varname, self.bounds, crs)
+        unknown = [var for var in ds.variables if var not in known]
         if len(unknown) > 0:
             messages.append(
                 f"(Coordinate) variable(s) {', '.join(unknown)} is/are not part of the CV."
@@ -723,15 +1039,16 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
         score = 0
         messages = []
 
-        required_attributes = self.CV.get("required_global_attributes", {})
-
+        required_attributes = self.required_attributes
         out_of = len(required_attributes)
 
-        for attr in required_attributes:
-            test = attr in list(self.dataset.ncattrs())
-            score += int(test)
-            if not test:
-                messages.append(f"Required global attribute '{attr}' is missing.")
+        missing = [
+            attr for attr in required_attributes if attr not in self.global_attrs
+        ]
+        score = out_of - len(missing)
+        messages.extend(
+            f"Required global attribute '{attr}' is missing." for attr in missing
+        )
 
         return self.make_result(level, score, out_of, desc, messages)
 
@@ -743,7 +1060,7 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
         out_of = 2
         messages = []
 
-        required_attributes = self.CV.get("required_global_attributes", {})
+        required_attributes = self.required_attributes
         file_attrs = {
             k: v for k, v in self.xrds.attrs.items() if k in required_attributes
         }
@@ -759,11 +1076,9 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
             messages.extend(ga_messages)
 
         # Unchecked global attributes
-        unchecked = [
-            key
-            for key in required_attributes
-            if not ga_checked[key] and key not in self.global_attrs_hard_checks
-        ]
+        unchecked = set(required_attributes).difference(
+            ga_checked, self.global_attrs_hard_checks
+        )
         if len(unchecked) == 0:
             score += 1
         else:
@@ -783,12 +1098,10 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
 
         # Check '_FillValue' and 'missing_value'
         if len(self.varname) > 0:
-            fval = ChainMap(
-                self.xrds[self.varname[0]].attrs, self.xrds[self.varname[0]].encoding
-            ).get("_FillValue", None)
-            mval = ChainMap(
-                self.xrds[self.varname[0]].attrs, self.xrds[self.varname[0]].encoding
-            ).get("missing_value", None)
+            var = self.xrds[self.varname[0]]
+            var_attrs = {**var.encoding, **var.attrs}
+            fval = var_attrs.get("_FillValue", None)
+            mval = var_attrs.get("missing_value", None)
             if fval is None or mval is None:
                 messages.append(
                     f"Both, 'missing_value' and '_FillValue' have to be set for variable '{self.varname[0]}'."
@@ -803,8 +1116,8 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
                 score += 2
             if self.missing_value and (fval or mval):
                 if not (
-                    np.isclose(self.missing_value, fval)
-                    and np.isclose(self.missing_value, mval)
+                    isclose(self.missing_value, fval)
+                    and isclose(self.missing_value, mval)
                 ):
                     messages.append(
                         f"The variable attributes '_FillValue' and/or 'missing_value' differ from "
@@ -829,9 +1142,9 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
 
         # Check if frequency is known and supported
         #  (as defined in deltdic)
-        if self.frequency in ["unknown", "fx"]:
+        if self.frequency in ("unknown", "fx"):
             return self.make_result(level, out_of, out_of, desc, messages)
-        if self.frequency not in deltdic.keys():
+        if self.deltmin is None or self.deltmax is None:
             messages.append(f"Frequency '{self.frequency}' not supported.")
             return self.make_result(level, score, out_of, desc, messages)
 
@@ -854,33 +1167,22 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
             # No check necessary
             return self.make_result(level, out_of, out_of, desc, messages)
         else:
-            deltfs = cftime.num2date(
-                self.time.values[1:], units=self.timeunits, calendar=self.calendar
-            ) - cftime.num2date(
-                self.time.values[:-1], units=self.timeunits, calendar=self.calendar
-            )
-            deltfs = get_tseconds_vector(deltfs)
-            ta = np.ones(len(deltfs) + 1, np.float64)
-            ta[:-1] = deltfs[:]
-            ta[-1] = deltdic[self.frequency + "min"]
-            tb = xr.DataArray(data=ta, dims=["time"], coords=dict(time=self.time))
-            tc = xr.where(tb < deltdic[self.frequency + "min"], 1, 0)
-            te = xr.where(tb > deltdic[self.frequency + "max"], 1, 0)
-            tf = tc + te
-            tg = tb.time.where(tf > 0, drop=True)
-            th = tb.where(tf > 0, drop=True)
-            tindex = xr.DataArray(
-                data=range(0, len(self.time)),
-                dims=["time"],
-                coords=dict(time=self.time),
-            )
-            tindex_f = tindex.where(tf > 0, drop=True)
-            for tstep in range(0, th.size):
-                messages.append(
-                    f"Discontinuity in time axis (frequency: '{self.frequency}') at index '{tindex_f[tstep]}'"
-                    f" ('{cftime.num2date(tg.values[tstep], calendar=self.calendar, units=self.timeunits)}'):"
-                    f" delta-t {printtimedelta(th.values[tstep])} from next timestep!"
+            # Read the time values only once
+            t_vals = np.asarray(self.time.values)
+            deltfs = self._deltas_in_seconds(t_vals[1:], t_vals[:-1])
+            ta = np.empty(len(deltfs) + 1, np.float64)
+            ta[:-1] = deltfs
+            ta[-1] = self.deltmin
+            bad_idx = find_discontinuities(ta, self.deltmin, self.deltmax)
+            self._num2date_many(t_vals[bad_idx[:MAX_OFFENDER_MESSAGES]])
+            messages.extend(
+                offender_messages(
+                    bad_idx,
+                    lambda tstep: f"Discontinuity in time axis (frequency: '{self.frequency}') at index '{tstep}'"
+                    f" ('{self._num2date(t_vals[tstep])}'):"
+                    f" delta-t {printtimedelta(ta[tstep])} from next timestep!",
                 )
+            )
 
             if len(messages) == 0:
                 score += 1
@@ -896,9 +1198,9 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
 
         # Check if frequency is known and supported
         #  (as defined in deltdic)
-        if self.frequency in ["unknown", "fx"]:
+        if self.frequency in ("unknown", "fx"):
             return self.make_result(level, out_of, out_of, desc, messages)
-        if self.frequency not in deltdic.keys():
+        if self.deltmin is None or self.deltmax is None:
             messages.append(f"Frequency '{self.frequency}' not supported.")
             return self.make_result(level, score, out_of, desc, messages)
         if self.cell_methods == "unknown":
@@ -929,7 +1231,7 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
             return self.make_result(level, score, out_of, desc, messages)
 
         # Check time bounds dimensions
-        time_bnds = self.xrds[self.timebnds]
+        time_bnds = self.xrds.variables[self.timebnds]
         if self.time.dims[0] != time_bnds.dims[0]:
             messages.append(
                 "The time coordinate variable and its bounds have a different first dimension."
@@ -943,80 +1245,84 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
         if len(messages) > 0:
             return self.make_result(level, score, out_of, desc, messages)
 
+        # Snapshot the time values and bounds as numpy arrays
+        t_val = np.asarray(self.time.values)
+        #  (the bounds are read from file exactly once)
+        tb_arr = np.asarray(time_bnds.values)
+        lo_bnd = tb_arr[:, 0]
+        hi_bnd = tb_arr[:, 1]
+
+        overlap_idx, uncentered_idx, nonmonotonic_idx = scan_time_bounds(
+            t_val, lo_bnd, hi_bnd
+        )
+        # Convert the time values of all reported offenders at once for the messages
+        overlap_rep = overlap_idx[:MAX_OFFENDER_MESSAGES]
+        self._num2date_many(
+            t_val[
+                np.concatenate(
+                    (
+                        overlap_rep,
+                        overlap_rep + 1,
+                        uncentered_idx[:MAX_OFFENDER_MESSAGES],
+                        nonmonotonic_idx[:MAX_OFFENDER_MESSAGES],
+                    )
+                )
+            ]
+        )
+
         # Check for overlapping bounds
-        if self.time.size == 1:
+        if len(overlap_idx) == 0:
             score += 1
         else:
-            deltb = time_bnds[1:, 0].values - time_bnds[:-1, 1].values
-            overlap_idx = np.where(deltb != 0)[0]
-            if len(overlap_idx) == 0:
-                score += 1
-            else:
-                for oi in overlap_idx:
-                    messages.append(
-                        f"The time bounds overlap between index '{oi}' ('"
-                        f"{cftime.num2date(self.time.values[oi], calendar=self.calendar, units=self.timeunits)}"
-                        f"') and index '{oi+1}' ('"
-                        f"{cftime.num2date(self.time.values[oi+1], calendar=self.calendar, units=self.timeunits)}')."
-                    )
+            messages.extend(
+                offender_messages(
+                    overlap_idx,
+                    lambda oi: f"The time bounds overlap between index '{oi}' ('"
+                    f"{self._num2date(t_val[oi])}"
+                    f"') and index '{oi+1}' ('"
+                    f"{self._num2date(t_val[oi+1])}').",
+                )
+            )
 
         # Check if time values are centered within their respective bounds
-        delt = (
-            self.time.values[:]
-            + self.time.values[:]
-            - time_bnds[:, 1]
-            - time_bnds[:, 0]
-        )
-        if np.all(delt == 0):
+        if len(uncentered_idx) == 0:
             score += 1
         else:
-            uncentered_idx = np.where(delt != 0)[0]
-            for ui in uncentered_idx:
-                messages.append(
-                    f"For timestep with index '{ui}' ('"
-                    f"{cftime.num2date(self.time.values[ui], calendar=self.calendar, units=self.timeunits)}"
-                    "'), the time value is not centered within its respective bounds."
+            messages.extend(
+                offender_messages(
+                    uncentered_idx,
+                    lambda ui: f"For timestep with index '{ui}' ('"
+                    f"{self._num2date(t_val[ui])}"
+                    "'), the time value is not centered within its respective bounds.",
                 )
+            )
 
         # Check if time bounds are strong monotonically increasing
-        deltb = time_bnds[:, 1].values - time_bnds[:, 0].values
-        if np.all(deltb > 0):
+        if len(nonmonotonic_idx) == 0:
             score += 1
         else:
-            nonmonotonic_idx = np.where(deltb <= 0)[0]
-            for ni in nonmonotonic_idx:
-                messages.append(
-                    f"The time bounds for timestep with index '{ni}' "
-                    f"('{cftime.num2date(self.time.values[ni], calendar=self.calendar, units=self.timeunits)}"
-                    "') are not strong monotonically increasing."
+            messages.extend(
+                offender_messages(
+                    nonmonotonic_idx,
+                    lambda ni: f"The time bounds for timestep with index '{ni}' "
+                    f"('{self._num2date(t_val[ni])}"
+                    "') are not strong monotonically increasing.",
                 )
+            )
 
         # Check if time interval is as expected
-        deltfs = cftime.num2date(
-            time_bnds.values[:, 1], units=self.timeunits, calendar=self.calendar
-        ) - cftime.num2date(
-            time_bnds.values[:, 0], units=self.timeunits, calendar=self.calendar
-        )
-        deltfs = get_tseconds_vector(deltfs)
-        ti = xr.DataArray(data=deltfs, dims=["time"], coords=dict(time=self.time))
-        ti_l = xr.where(ti < deltdic[self.frequency + "min"], 1, 0)
-        ti_h = xr.where(ti > deltdic[self.frequency + "max"], 1, 0)
-        ti_lh = ti_l + ti_h
-        ti_t = ti.time.where(ti_lh > 0, drop=True)
-        ti_f = ti.where(ti_lh > 0, drop=True)
-        tindex = xr.DataArray(
-            data=range(0, len(self.time)), dims=["time"], coords=dict(time=self.time)
-        )
-        tindex_f = tindex.where(ti_lh > 0, drop=True)
-        failure = False
-        for tstep in range(0, ti_f.size):
-            failure = True
-            messages.append(
-                f"Discontinuity in time bounds (frequency: '{self.frequency}') at index '{int(tindex_f.values[tstep])}"
-                f"' ('{cftime.num2date(ti_t.values[tstep], calendar=self.calendar, units=self.timeunits)}'):"
-                f" time interval is of size '{printtimedelta(ti_f.values[tstep])}'!"
+        deltfs = self._deltas_in_seconds(hi_bnd, lo_bnd)
+        bad_idx = find_discontinuities(deltfs, self.deltmin, self.deltmax)
+        self._num2date_many(t_val[bad_idx[:MAX_OFFENDER_MESSAGES]])
+        messages.extend(
+            offender_messages(
+                bad_idx,
+                lambda tstep: f"Discontinuity in time bounds (frequency: '{self.frequency}') at index '{tstep}"
+                f"' ('{self._num2date(t_val[tstep])}'):"
+                f" time interval is of size '{printtimedelta(deltfs[tstep])}'!",
             )
-        if not failure:
+        )
+        if len(bad_idx) == 0:
             score += 1
 
         return self.make_result(level, score, out_of, desc, messages)
@@ -1073,23 +1379,26 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
             score += 1
 
         # Get the time axis, calendar and units
-        if any([tm is None for tm in [self.time, self.calendar, self.timeunits]]):
+        if self.time is None or self.calendar is None or self.timeunits is None:
             # Check cannot be continued, but this error will be raised in another check
             score += 1
             return self.make_result(level, score, out_of, desc, messages)
 
         # Check if the time_range element matches with the time values
-        format = "%4Y%2m%2d%2H%2M"
-        t0 = cftime.num2date(
-            self.time.values[0], calendar=self.calendar, units=self.timeunits
-        )
-        t1 = cftime.num2date(
-            self.time.values[-1], calendar=self.calendar, units=self.timeunits
-        )
-        time_range_str = (
-            f"{t0.strftime(format=format)[:len(time_range_arr[0])]}-"
-            f"{t1.strftime(format=format)[:len(time_range_arr[0])]}"
-        )
+        t0 = self._num2date(self.time.values[0])
+        t1 = self._num2date(self.time.values[-1])
+        nchars = len(time_range_arr[0])
+        format = TIME_RANGE_FORMATS.get(nchars, None)
+        if format is not None:
+            time_range_str = (
+                f"{t0.strftime(format=format)}-{t1.strftime(format=format)}"
+            )
+        else:
+            format = TIME_RANGE_FORMATS[12]
+            time_range_str = (
+                f"{t0.strftime(format=format)[:nchars]}-"
+                f"{t1.strftime(format=format)[:nchars]}"
+            )
         if self.drs_fn["time_range"] == time_range_str:
             score += 1
         else:
@@ -1109,12 +1418,12 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
 
         # Check version/version_date in DRS path (format vYYYYMMDD, not in the future)
         if self.drs_dir["version"]:
-            if not re.fullmatch(r"^v[0-9]{8}$", self.drs_dir["version"]):
+            if not VERSION_RE.fullmatch(self.drs_dir["version"]):
                 messages.append(
                     "The 'version' element in the path is not of the format 'vYYYYMMDD':"
                     f" '{self.drs_dir['version']}'."
                 )
-            elif dt.strptime(self.drs_dir["version"][1:], "%Y%m%d") > dt.now():
+            elif parse_version_date(self.drs_dir["version"]) > dt.now():
                 messages.append(
                     f"The 'version' element in the path is in the future:"
                     f" '{self.drs_dir['version'][1:5]}-{self.drs_dir['version'][5:7]}"
@@ -1137,17 +1446,11 @@ class MIPCVCheck(BaseNCCheck, MIPCVCheckBase):
 
         # Check global attribute creation_date (format YYYY-MM-DDTHH:MM:SSZ, not in the future)
         if "creation_date" in self.xrds.attrs:
-            if not re.fullmatch(
-                r"^[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}Z$",
-                self.xrds.attrs["creation_date"],
-            ):
+            if not CREATION_DATE_RE.fullmatch(self.xrds.attrs["creation_date"]):
                 messages.append(
                     f"The 'creation_date' attribute is not of the format 'YYYY-MM-DDTHH:MM:SSZ': '{self.xrds.attrs['creation_date']}'"
                 )
-            elif (
-                dt.strptime(self.xrds.attrs["creation_date"], "%Y-%m-%dT%H:%M:%SZ")
-                > dt.now()
-            ):
+            elif parse_creation_date(self.xrds.attrs["creation_date"]) > dt.now():
                 messages.append(
                     f"The 'creation_date' attribute is in the future: '{self.xrds.attrs['creation_date']}'"
                 )
@@ -0,0 +1,48 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from compliance_checker.suite import CheckSuite
+
+from .cc6 import CORDEXCMIP6
+
+# Number of files sent to a worker process at once
+CHUNKSIZE = 8
+
+
+def _run_one(index, filepath, tables, output_dir, checker):
+    """Set up the checker for a single file, writing its consistency output."""
+    # Prefix the index, since file names may repeat (eg. for different versions)
+    consistency_output = os.path.join(
+        output_dir,
+        f"{index:06d}_" + os.path.splitext(os.path.basename(filepath))[0] + ".json",
+    )
+    options = {"consistency_output": consistency_output}
+    if tables:
+        options["tables"] = tables
+    # Load the dataset as cchecker does (eg. also remote or CDL datasets)
+    ds = CheckSuite().load_dataset(filepath)
+    try:
+        check = checker(options=options)
+        check.setup(ds)
+    finally:
+        ds.close()
+    return consistency_output
+
+
+def run_batch(
+    filepaths, tables=None, output_dir=".", workers=None, checker=CORDEXCMIP6
+):
+    """
+    Write the output for consistency checks for many files in parallel.
+
+    Each worker process parses the CV and CMOR tables only once.
+    Returns the paths of the written consistency output files.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    filepaths = list(filepaths)
+    run_one = partial(_run_one, tables=tables, output_dir=output_dir, checker=checker)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(
+            ex.map(run_one, range(len(filepaths)), filepaths, chunksize=CHUNKSIZE)
+        )
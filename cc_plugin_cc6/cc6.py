@@ -1,6 +1,9 @@
+import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from functools import lru_cache
 
 import cf_xarray  # noqa
 import cftime
@@ -12,7 +15,55 @@ from ._constants import deltdic
 from .base import MIPCVCheck
 from .tables import retrieve
 
+logger = logging.getLogger(__name__)
+
 CORDEX_CMIP6_CMOR_TABLES_URL = "https://raw.githubusercontent.com/WCRP-CORDEX/cordex-cmip6-cmor-tables/main/Tables/"
+CORDEX_CMIP6_CMOR_TABLES = (
+    "coordinate",
+    "grids",
+    "formula_terms",
+    "CV",
+    "1hr",
+    "6hr",
+    "day",
+    "mon",
+    "fx",
+)
+
+# cell_methods of instantaneous and of statistical (time) values
+CELL_METHODS_POINT_RE = re.compile(r"^.*time: point.*$", flags=re.ASCII)
+CELL_METHODS_STAT_RE = re.compile(
+    r"^.*time: (maximum|minimum|mean|sum).*$", flags=re.ASCII
+)
+# Suggested form of the grid description
+GRID_DESCRIPTION_RE = re.compile(r"^.* with .* grid spacing.*$")
+
+
+def _retrieve_table(table, tables_path):
+    """Download a single CV or CMOR table to tables_path."""
+    filename = "CORDEX-CMIP6_" + table + ".json"
+    url = CORDEX_CMIP6_CMOR_TABLES_URL + filename
+    filename_retrieved = retrieve(url, filename, tables_path)
+    if os.path.basename(os.path.realpath(filename_retrieved)) != filename:
+        raise AssertionError(
+            f"Download failed for CV table '{filename_retrieved}' (source: '{url}')."
+        )
+
+
+@lru_cache(maxsize=None)
+def _retrieve_tables(tables_path):
+    """Download the CV and CMOR tables to tables_path, once per process."""
+    logger.debug("Downloading CV and CMOR tables.")
+    # The downloads are independent, so they are run concurrently
+    with ThreadPoolExecutor(max_workers=len(CORDEX_CMIP6_CMOR_TABLES)) as ex:
+        # Consume the results to raise the first failure (if any)
+        list(
+            ex.map(
+                _retrieve_table,
+                CORDEX_CMIP6_CMOR_TABLES,
+                [tables_path] * len(CORDEX_CMIP6_CMOR_TABLES),
+            )
+        )
 
 
 class CORDEXCMIP6(MIPCVCheck):
@@ -21,46 +72,11 @@ class CORDEXCMIP6(MIPCVCheck):
     _cc_spec_version = __version__
     _cc_description = "Checks compliance with CORDEX-CMIP6."
     _cc_url = "https://github.com/euro-cordex/cc-plugin-cc6"
-
-    def setup(self, dataset):
-        super().setup(dataset)
-        if not self.options.get("tables", False):
-            if self.debug:
-                print("Downloading CV and CMOR tables.")
-            tables_path = "~/.cc6_metadata/cordex-cmip6-cmor-tables"
-            for table in [
-                "coordinate",
-                "grids",
-                "formula_terms",
-                "CV",
-                "1hr",
-                "6hr",
-                "day",
-                "mon",
-                "fx",
-            ]:
-                filename = "CORDEX-CMIP6_" + table + ".json"
-                url = CORDEX_CMIP6_CMOR_TABLES_URL + filename
-                filename_retrieved = retrieve(
-                    CORDEX_CMIP6_CMOR_TABLES_URL + "CORDEX-CMIP6_" + table + ".json",
-                    filename,
-                    tables_path,
-                )
-                if os.path.basename(os.path.realpath(filename_retrieved)) != filename:
-                    raise AssertionError(
-                        f"Download failed for CV table '{filename_retrieved}' (source: '{url}')."
-                    )
-
-            self._initialize_CV_info(tables_path)
-            self._initialize_time_info()
-            self._initialize_coords_info()
-        if self.consistency_output:
-            self._write_consistency_output()
-
-        # Specify the global attributes that will be checked by a specific check
-        #  rather than a general check against the value given in the CV
-        #  (i.e. because it does not explicitly defined in the CV)
-        self.global_attrs_hard_checks = [
+    # Specify the global attributes that will be checked by a specific check
+    #  rather than a general check against the value given in the CV
+    #  (i.e. because it does not explicitly defined in the CV)
+    global_attrs_hard_checks = frozenset(
+        {
             "contact",
             "creation_date",
             "domain_id",
@@ -69,7 +85,24 @@ class CORDEXCMIP6(MIPCVCheck):
             "time_range",
             "variable_id",
             "version",
-        ]
+        }
+    )
+
+    def setup(self, dataset):
+        super().setup(dataset)
+        if not self.options.get("tables", False):
+            # Local copy of the CMOR tables
+            tables_path = os.environ.get("CORDEXCMIP6TABLESPATH", "")
+            if not tables_path:
+                tables_path = "~/.cc6_metadata/cordex-cmip6-cmor-tables"
+                _retrieve_tables(tables_path)
+
+            self._initialize_CV_info(tables_path)
+            self._initialize_time_info()
+            self._initialize_coords_info()
+            # Else already written in MIPCVCheck.setup
+            if self.consistency_output:
+                self._write_consistency_output()
 
     def check_format(self, ds):
         """Checks if the file is in the expected format."""
@@ -105,31 +138,32 @@ class CORDEXCMIP6(MIPCVCheck):
         score = 0
         messages = []
 
-        if len(self.varname) > 0:
-            varname = self.varname[0]
-        else:
-            varname = False
-        if varname is False:
-            score += 1
-        elif (
-            ds[varname].filters()["complevel"] != 1
-            or ds[varname].filters()["shuffle"] is False
-        ):
+        # Nothing to check if no variable could be identified
+        if len(self.varname) == 0:
+            return self.make_result(level, out_of, out_of, desc, messages)
+
+        # Query the filter settings only once
+        filters = ds[self.varname[0]].filters()
+        complevel = filters.get("complevel", 0)
+        shuffle = filters.get("shuffle", False)
+
+        # Recommended settings - no messages required
+        if complevel == 1 and shuffle:
+            return self.make_result(level, out_of, out_of, desc, messages)
+
+        messages.append(
+            "It is recommended that data should be compressed with a 'deflate level' of '1' "
+            "and enabled 'shuffle' option."
+        )
+        if complevel < 1:
+            messages.append(" The data is uncompressed.")
+        elif complevel > 1:
             messages.append(
-                "It is recommended that data should be compressed with a 'deflate level' of '1' "
-                "and enabled 'shuffle' option."
+                " The data is compressed with a higher 'deflate level' than recommended, "
+                "this can lead to performance issues when accessing the data."
             )
-            if ds[varname].filters()["complevel"] < 1:
-                messages.append(" The data is uncompressed.")
-            elif ds[varname].filters()["complevel"] > 1:
-                messages.append(
-                    " The data is compressed with a higher 'deflate level' than recommended, "
-                    "this can lead to performance issues when accessing the data."
-                )
-            if ds[varname].filters()["shuffle"] is False:
-                messages.append(" The 'shuffle' option is disabled.")
-        else:
-            score += 1
+        if not shuffle:
+            messages.append(" The 'shuffle' option is disabled.")
 
         return self.make_result(level, score, out_of, desc, messages)
 
@@ -147,7 +181,7 @@ class CORDEXCMIP6(MIPCVCheck):
         #  deltdic.keys() - whatever frequencies are defined there
         if self.frequency in ["unknown", "fx"]:
             return self.make_result(level, out_of, out_of, desc, messages)
-        if self.frequency not in deltdic.keys() or self.frequency not in [
+        if self.frequency not in deltdic or self.frequency not in [
             "1hr",
             "6hr",
             "day",
@@ -167,17 +201,12 @@ class CORDEXCMIP6(MIPCVCheck):
         if len(messages) > 0:
             return self.make_result(level, score, out_of, desc, messages)
 
-        # Get the first and last time values
-        first_time = self.time[0].values
-        last_time = self.time[-1].values
-
         # Convert the first and last time values to cftime.datetime objects
-        first_time = cftime.num2date(
-            first_time, calendar=self.calendar, units=self.timeunits
-        )
-        last_time = cftime.num2date(
-            last_time, calendar=self.calendar, units=self.timeunits
-        )
+        #  (in one call, the results are cached for the other time checks)
+        t_vals = self.time.values
+        self._num2date_many(t_vals[[0, -1]])
+        first_time = self._num2date(t_vals[0])
+        last_time = self._num2date(t_vals[-1])
 
         # File chunks as requested by CORDEX-CMIP6
         if self.frequency == "mon":
@@ -202,17 +231,11 @@ class CORDEXCMIP6(MIPCVCheck):
             offset = timedelta(hours=12)
 
         # Modify expected start and end dates based on cell_methods and above offset
-        if bool(re.fullmatch("^.*time: point.*$", self.cell_methods, flags=re.ASCII)):
+        if CELL_METHODS_POINT_RE.fullmatch(self.cell_methods):
             expected_end_date = expected_end_date - timedelta(
                 seconds=deltdic[self.frequency] - offset - offset
             )
-        elif bool(
-            re.fullmatch(
-                "^.*time: (maximum|minimum|mean|sum).*$",
-                self.cell_methods,
-                flags=re.ASCII,
-            )
-        ):
+        elif CELL_METHODS_STAT_RE.fullmatch(self.cell_methods):
             expected_start_date += timedelta(
                 seconds=deltdic[self.frequency] / 2.0 - offset
             )
@@ -260,7 +283,7 @@ class CORDEXCMIP6(MIPCVCheck):
         if self.frequency in ["unknown", "fx"]:
             # Potential error would be raised in base check
             return self.make_result(level, out_of, out_of, desc, messages)
-        if self.frequency not in deltdic.keys() or self.frequency not in [
+        if self.frequency not in deltdic or self.frequency not in [
             "1hr",
             "6hr",
             "day",
@@ -280,17 +303,12 @@ class CORDEXCMIP6(MIPCVCheck):
         if len(messages) > 0:
             return self.make_result(level, score, out_of, desc, messages)
 
-        # Get the first and last time values
-        first_time = self.time[0].values
-        last_time = self.time[-1].values
-
         # Convert the first and last time values to cftime.datetime objects
-        first_time = cftime.num2date(
-            first_time, calendar=self.calendar, units=self.timeunits
-        )
-        last_time = cftime.num2date(
-            last_time, calendar=self.calendar, units=self.timeunits
-        )
+        #  (in one call, the results are cached for the other time checks)
+        t_vals = self.time.values
+        self._num2date_many(t_vals[[0, -1]])
+        first_time = self._num2date(t_vals[0])
+        last_time = self._num2date(t_vals[-1])
 
         # Compile the expected time_range
         if self.frequency == "mon":
@@ -440,7 +458,7 @@ class CORDEXCMIP6(MIPCVCheck):
             score += 1
         else:
             # Check if grid description is following the examples
-            if re.fullmatch(r"^.* with .* grid spacing.*$", grid):
+            if GRID_DESCRIPTION_RE.fullmatch(grid):
                 score += 1
             else:
                 messages.append(
@@ -510,8 +528,8 @@ class CORDEXCMIP6(MIPCVCheck):
 
         # If the grid is rectilinear, the domain_id needs to include the suffix "i"
         try:
-            lat = self.xrds.cf.coordinates["latitude"][0]
-            lon = self.xrds.cf.coordinates["longitude"][0]
+            lat = self.cf_coordinates["latitude"][0]
+            lon = self.cf_coordinates["longitude"][0]
         except KeyError:
             messages.append(
                 "Cannot check 'domain_id' as latitude and longitude coordinate variables could not be identified."
@@ -1,3 +1,4 @@
+import json
 import os
 
 # Specify test data repo and cache directory
@@ -23,3 +24,37 @@ DATASETS = {
     "TAS_REMO": TAS_REMO,
     "FXOROG_REMO": FXOROG_REMO,
 }
+
+# Minimal CV and CMOR tables
+TABLES_MINIMAL = {
+    "CV": {
+        "CV": {
+            "required_global_attributes": ["domain_id", "frequency", "variable_id"],
+            "domain_id": ["EUR-12"],
+            "frequency": {"mon": "monthly mean samples"},
+            "DRS": {
+                "directory_path_template": "<domain_id>/<frequency>/<variable_id>",
+                "filename_template": "<variable_id>_<domain_id>_<frequency>.nc",
+            },
+        }
+    },
+    "grids": {
+        "axis_entry": {"rlat": {"out_name": "rlat"}},
+        "variable_entry": {"lat": {"out_name": "lat"}},
+    },
+    "coordinate": {"axis_entry": {"time": {"out_name": "time"}}},
+    "formula_terms": {"formula_entry": {"ps": {"out_name": "ps"}}},
+    "mon": {
+        "Header": {"table_id": "Table mon", "missing_value": "1e20"},
+        "variable_entry": {"tas": {"frequency": "mon"}},
+    },
+}
+
+
+def write_tables(path, tables):
+    """Write the given tables as 'CORDEX-CMIP6_<table_name>.json' to a new directory."""
+    os.makedirs(path)
+    for table_name, table in tables.items():
+        with open(os.path.join(path, f"CORDEX-CMIP6_{table_name}.json"), "w") as f:
+            json.dump(table, f)
+    return str(path)
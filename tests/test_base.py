@@ -0,0 +1,204 @@
+import json
+import logging
+import os
+
+import numpy as np
+import pytest
+from _commons import TABLES_MINIMAL, write_tables
+from netCDF4 import Dataset
+
+from cc_plugin_cc6.base import (
+    MAX_OFFENDER_MESSAGES,
+    MIPCVCheck,
+    _scan_tables,
+    offender_messages,
+    seconds_per_time_unit,
+)
+
+# CV lists with literal and regex entries, the latter partly with inline flags
+#  and backreferences (which cannot be combined into a single alternation regex)
+CV_LIST = ["EUR-12", "NAM-[[:digit:]]{2}"]
+CV_LIST_UNCOMBINABLE = CV_LIST + ["(?i)afr-44", r"(x+)-\1"]
+
+
+@pytest.fixture
+def check():
+    check = MIPCVCheck(options={})
+    check.debug = False
+    return check
+
+
+@pytest.mark.parametrize(
+    "el, val, expected",
+    [
+        (CV_LIST, "EUR-12", True),
+        (CV_LIST, "NAM-25", True),
+        (CV_LIST, "NAM-2", False),
+        (CV_LIST, "AFR-44", False),
+        (CV_LIST_UNCOMBINABLE, "EUR-12", True),
+        (CV_LIST_UNCOMBINABLE, "NAM-25", True),
+        (CV_LIST_UNCOMBINABLE, "NAM-2", False),
+        (CV_LIST_UNCOMBINABLE, "AFR-44", True),
+        (CV_LIST_UNCOMBINABLE, "xx-xx", True),
+        (CV_LIST_UNCOMBINABLE, "xx-x", False),
+        (CV_LIST_UNCOMBINABLE, "SAM-22", False),
+    ],
+)
+def test_compare_CV_element_mixed_list(check, el, val, expected):
+    assert check._compare_CV_element(el, val) == (expected, ())
+
+
+def test_read_CVs_combined_table(tmp_path):
+    path_single = write_tables(tmp_path / "single", TABLES_MINIMAL)
+    path_all = write_tables(tmp_path / "all", {"all": TABLES_MINIMAL})
+    bundle_single = MIPCVCheck._get_cv_bundle(path_single, _scan_tables(path_single))
+    bundle_all = MIPCVCheck._get_cv_bundle(path_all, _scan_tables(path_all))
+    assert bundle_all == bundle_single
+    assert bundle_all.varlist == {"tas"}
+    assert bundle_all.cvars == {"rlat", "lat", "time", "ps"}
+
+
+def test_read_CVs_missing_table(tmp_path):
+    tables = {k: v for k, v in TABLES_MINIMAL.items() if k != "grids"}
+    tables_path = write_tables(tmp_path / "tables", tables)
+    with pytest.raises(
+        Exception, match="Could not find or open table 'CORDEX-CMIP6_grids.json'"
+    ):
+        MIPCVCheck._get_cv_bundle(tables_path, _scan_tables(tables_path))
+
+
+@pytest.fixture
+def tas_file(tmp_path):
+    filepath = str(tmp_path / "tas.nc")
+    with Dataset(filepath, "w") as ds:
+        ds.createDimension("time", 2)
+        time = ds.createVariable("time", "f8", ("time",))
+        time.units = "days since 1950-01-01"
+        time.calendar = "standard"
+        time[:] = [0.0, 1.0]
+        tas = ds.createVariable("tas", "f4", ("time",), fill_value=1e20)
+        tas.scale_factor = 2.0
+        tas.set_auto_maskandscale(False)
+        tas[:] = [1e20, 0.5]
+    return filepath
+
+
+def test_setup_keeps_dataset_settings(tmp_path, tas_file):
+    tables_path = write_tables(tmp_path / "tables", TABLES_MINIMAL)
+    with Dataset(tas_file) as ds:
+        check = MIPCVCheck(options={"tables": tables_path})
+        check.setup(ds)
+        # The netCDF4.Dataset is shared with other checkers, it is still
+        #  masked and scaled
+        assert ds["tas"][:].tolist() == [None, 1.0]
+
+
+def test_setup_modified_table(tmp_path, tas_file):
+    tables_path = write_tables(tmp_path / "tables", TABLES_MINIMAL)
+    with Dataset(tas_file) as ds:
+        check = MIPCVCheck(options={"tables": tables_path})
+        check.setup(ds)
+        assert check.CV["domain_id"] == ["EUR-12"]
+        # Rewrite the CV in place (the directory modification time is unchanged)
+        cv_path = os.path.join(tables_path, "CORDEX-CMIP6_CV.json")
+        mtime_dir = os.stat(tables_path).st_mtime_ns
+        CV = {"CV": dict(TABLES_MINIMAL["CV"]["CV"], domain_id=["AFR-22"])}
+        with open(cv_path, "w") as f:
+            json.dump(CV, f)
+        mtime = os.stat(cv_path).st_mtime_ns + 1_000_000_000
+        os.utime(cv_path, ns=(mtime, mtime))
+        assert os.stat(tables_path).st_mtime_ns == mtime_dir
+        check = MIPCVCheck(options={"tables": tables_path})
+        check.setup(ds)
+        assert check.CV["domain_id"] == ["AFR-22"]
+
+
+@pytest.mark.parametrize(
+    "options, level", [({}, logging.DEBUG), ({"debug": True}, logging.WARNING)]
+)
+def test_debug_option(tmp_path, tas_file, caplog, options, level):
+    tables_path = write_tables(tmp_path / "tables", TABLES_MINIMAL)
+    caplog.set_level(logging.DEBUG, logger="cc_plugin_cc6")
+    with Dataset(tas_file) as ds:
+        check = MIPCVCheck(options={"tables": tables_path, **options})
+        check.setup(ds)
+    caplog.clear()
+    check._compare_CV({"domain_id": "EUR-12"}, "")
+    assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+        (level, "domain_id"),
+        (level, "domain_id 1st level"),
+        (level, "EUR-12 ->1 and 2"),
+    ]
+
+
+@pytest.mark.parametrize("extra", [0, 1, 25])
+def test_offender_messages(extra):
+    idx = np.arange(MAX_OFFENDER_MESSAGES + extra)
+    messages = offender_messages(idx, lambda i: f"Timestep {i}.")
+    assert messages[:MAX_OFFENDER_MESSAGES] == [
+        f"Timestep {i}." for i in range(MAX_OFFENDER_MESSAGES)
+    ]
+    if extra:
+        assert messages[MAX_OFFENDER_MESSAGES:] == [
+            f"... and {extra} more timestep(s) with the same issue."
+        ]
+    else:
+        assert len(messages) == MAX_OFFENDER_MESSAGES
+
+
+# Characters matched and not matched by the POSIX character classes
+POSIX_CLASSES = {
+    "alnum": ("aZ5", "_- "),
+    "alpha": ("aZ", "5_ "),
+    "blank": (" \t", "\na"),
+    "digit": ("09", "a "),
+    "lower": ("az", "A0"),
+    "punct": ("!-/:@[\\`{~_", "aZ0 "),
+    "space": (" \t\n", "a_"),
+    "upper": ("AZ", "a0"),
+    "word": ("aZ0_", "- "),
+    "xdigit": ("09afAF", "gG"),
+}
+
+
+@pytest.mark.parametrize(
+    "posix_class, val, expected",
+    [
+        (posix_class, val, expected)
+        for posix_class, (matched, not_matched) in POSIX_CLASSES.items()
+        for chars, expected in ((matched, True), (not_matched, False))
+        for val in chars
+    ],
+)
+def test_compare_CV_element_posix_class(check, posix_class, val, expected):
+    assert check._compare_CV_element(f"[[:{posix_class}:]]", val) == (expected, ())
+
+
+@pytest.mark.parametrize(
+    "val, expected",
+    [
+        ("REMO2020", True),
+        ("REMO2020-v1", True),
+        ("REMO2020_v1.1", True),
+        ("REMO2020 v1", False),
+        ("-REMO2020", False),
+    ],
+)
+def test_compare_CV_element_punct(check, val, expected):
+    el = "[[:alnum:]]+([[:punct:]][[:alnum:]]+)*"
+    assert check._compare_CV_element(el, val) == (expected, ())
+
+
+@pytest.mark.parametrize(
+    "timeunits, seconds",
+    [
+        ("days since 1949-12-01T00:00:00Z", 86400.0),
+        ("hours since 1950-01-01", 3600.0),
+        ("minutes since 1950-01-01", 60.0),
+        ("seconds since 1950-01-01", 1.0),
+        ("months since 1950-01-01", None),
+        ("days", None),
+    ],
+)
+def test_seconds_per_time_unit(timeunits, seconds):
+    assert seconds_per_time_unit(timeunits) == seconds
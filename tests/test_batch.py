@@ -0,0 +1,32 @@
+import json
+import os
+
+from _commons import DATASETS
+from compliance_checker.suite import CheckSuite
+
+from cc_plugin_cc6.batch import run_batch
+
+FILEPATHS = [DATASETS["TAS_REMO"], DATASETS["FXOROG_REMO"]]
+
+
+def test_run_batch(load_test_data, tmp_path):
+    outputs = run_batch(FILEPATHS, output_dir=str(tmp_path / "batch"), workers=2)
+    assert [os.path.basename(o) for o in outputs] == [
+        f"{i:06d}_" + os.path.splitext(os.path.basename(f))[0] + ".json"
+        for i, f in enumerate(FILEPATHS)
+    ]
+    # The output equals the one written when running the checker on a single file
+    for filepath, output in zip(FILEPATHS, outputs):
+        consistency_output = str(tmp_path / "single.json")
+        cs = CheckSuite(options={"cc6": {"consistency_output": consistency_output}})
+        cs.load_all_available_checkers()
+        cs.run_all(cs.load_dataset(filepath), ["cc6"], skip_checks=[])
+        with open(output) as f, open(consistency_output) as f_single:
+            batch_info = json.load(f)
+            assert batch_info == json.load(f_single)
+        assert set(batch_info) == {
+            "global_attributes",
+            "variable_attributes",
+            "coordinates",
+            "time_info",
+        }
@@ -1,9 +1,10 @@
 import re
 
 import pytest
-from _commons import DATASETS
+from _commons import DATASETS, TABLES_MINIMAL, write_tables
 from compliance_checker.suite import CheckSuite
 from importlib_metadata import entry_points
+from netCDF4 import Dataset
 
 from cc_plugin_cc6.cc6 import CORDEXCMIP6 as cc6
 
@@ -90,6 +91,15 @@ def test_cc6_basic(load_test_data):
     print(res_fx)  # noqa
 
 
+def test_cc6_tables_path_env(load_test_data, tmp_path, monkeypatch):
+    tables_path = write_tables(tmp_path / "tables", TABLES_MINIMAL)
+    monkeypatch.setenv("CORDEXCMIP6TABLESPATH", tables_path)
+    check = cc6(options={})
+    with Dataset(DATASETS["TAS_REMO"]) as ds:
+        check.setup(ds)
+    assert check.CV == TABLES_MINIMAL["CV"]["CV"]
+
+
 @pytest.mark.xfail
 def test_cc6_check_has_id(load_test_data, cc6_checks):
     c = getattr(cc6, cc6_checks)
@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+import pytest
+
+from cc_plugin_cc6._constants import deltdic
+
+# Maximum deviations from the frequencies, as originally defined
+DELTAS = {
+    "monmax": timedelta(days=31.5),
+    "monmin": timedelta(days=27.5),
+    "mon": timedelta(days=31),
+    "daymax": timedelta(days=1.1),
+    "daymin": timedelta(days=0.9),
+    "day": timedelta(days=1),
+    "1hrmin": timedelta(hours=0.9),
+    "1hrmax": timedelta(hours=1.1),
+    "1hr": timedelta(hours=1),
+    "3hrmin": timedelta(hours=2.9),
+    "3hrmax": timedelta(hours=3.1),
+    "3hr": timedelta(hours=3),
+    "6hrmin": timedelta(hours=5.9),
+    "6hrmax": timedelta(hours=6.1),
+    "6hr": timedelta(hours=6),
+    "yrmax": timedelta(days=366.1),
+    "yrmin": timedelta(days=359.9),
+    "yr": timedelta(days=360),
+}
+
+
+@pytest.mark.parametrize("key, delta", DELTAS.items())
+def test_deltdic(key, delta):
+    assert deltdic[key] == delta.total_seconds()
+
+
+def test_deltdic_read_only():
+    assert deltdic.keys() == DELTAS.keys()
+    with pytest.raises(TypeError):
+        deltdic["day"] = 0.0